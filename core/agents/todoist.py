@@ -6,7 +6,9 @@ and the user's specific workflow design.
 """
 
 import os
+import re
 import json
+import itertools
 from pathlib import Path
 from typing import Optional, Literal
 from datetime import datetime, timezone
@@ -15,6 +17,22 @@ from todoist_api_python.api import TodoistAPI
 from todoist_api_python.models import Task, Project, Section, Label, Comment
 from core.agents.base import BaseAgent
 
+# One label per comma-separated token, without leading @ or surrounding whitespace
+_LABEL_RX = re.compile(r"[^,\s@][^,]*(?<!\s)")
+
+
+def _normalize_labels(labels: list[str] | str) -> Optional[list[str]]:
+    """
+    Strip @ and whitespace from labels, splitting a comma-separated string.
+
+    Returns None when labels is a string that contains no label names.
+    """
+    # Handle case where labels is accidentally passed as a string instead of list
+    if isinstance(labels, str):
+        # Split comma-separated labels and strip @ and whitespace in one pass
+        return _LABEL_RX.findall(labels) or None
+    return [label.lstrip('@').strip() for label in labels]
+
 
 class TodoistAgent(BaseAgent):
     """
@@ -123,13 +141,9 @@ class TodoistAgent(BaseAgent):
         This method iterates through ALL pages to return the complete task list.
         """
         tasks_paginator = self.api.get_tasks(**kwargs)
-        all_tasks = []
-
-        # Iterate through ALL pages of results
-        for page in tasks_paginator:
-            all_tasks.extend(page)
 
-        return all_tasks
+        # Flatten ALL pages of results in a single pass
+        return list(itertools.chain.from_iterable(tasks_paginator))
 
     def _success(self, content: str, data: dict = None) -> str:
         """Helper to return structured success response."""
@@ -253,15 +267,14 @@ class TodoistAgent(BaseAgent):
 
             # Add labels if provided (remove @ prefix if present)
             if labels:
-                # Handle case where labels is accidentally passed as a string instead of list
-                if isinstance(labels, str):
-                    # Check if it's a comma-separated string
-                    if ',' in labels:
-                        labels = [label.strip().lstrip('@') for label in labels.split(',')]
-                    else:
-                        labels = [labels]
-                clean_labels = [label.lstrip('@').strip() for label in labels]
-                task_data["labels"] = clean_labels
+                raw_labels = labels
+                labels = _normalize_labels(raw_labels)
+                if labels is None:
+                    return self._error(
+                        "InvalidLabels",
+                        f"No valid labels found in {raw_labels!r}. Pass label names like 'home,chore'."
+                    )
+                task_data["labels"] = labels
 
             # Add due date if provided
             if due_string:
@@ -441,14 +454,14 @@ class TodoistAgent(BaseAgent):
                 update_data["content"] = content
 
             if labels is not None:
-                # Handle case where labels is accidentally passed as a string instead of list
-                if isinstance(labels, str):
-                    # Check if it's a comma-separated string
-                    if ',' in labels:
-                        labels = [label.strip().lstrip('@') for label in labels.split(',')]
-                    else:
-                        labels = [labels]
-                clean_labels = [label.lstrip('@').strip() for label in labels]
+                clean_labels = _normalize_labels(labels)
+                if clean_labels is None:
+                    # Sending [] would silently wipe every label on the task
+                    return self._error(
+                        "InvalidLabels",
+                        f"No valid labels found in {labels!r}. "
+                        f"Pass label names like 'home,chore', or an empty list to clear labels."
+                    )
                 update_data["labels"] = clean_labels
 
             if priority is not None:
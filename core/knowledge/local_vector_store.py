@@ -7,19 +7,13 @@ for retrieving relevant context. Suitable for CoderAgent and DocumentAgent.
 
 import os
 from pathlib import Path
-from typing import Optional
-
-try:
-    import chromadb
-    from chromadb.config import Settings
-except ImportError:
-    raise ImportError(
-        "ChromaDB is required for LocalVectorStore. "
-        "Install it with: pip install chromadb"
-    )
+from typing import TYPE_CHECKING, Optional
 
 from core.knowledge.base_store import BaseKnowledgeStore
 
+if TYPE_CHECKING:
+    import chromadb
+
 
 class LocalVectorStore(BaseKnowledgeStore):
     """
@@ -43,16 +37,30 @@ class LocalVectorStore(BaseKnowledgeStore):
         self.collection_name = config.get("collection_name", "default")
         self.chunk_size = config.get("chunk_size", 1000)
 
-        self.client: Optional[chromadb.Client] = None
+        self.client: Optional["chromadb.ClientAPI"] = None
         self.collection = None
 
     def initialize(self, config: dict) -> None:
         """
         Initialize ChromaDB client and collection.
 
+        ChromaDB is imported here rather than at module import so that CLI
+        paths which never touch the vector store don't pay its startup cost.
+
         Args:
             config: Configuration dictionary (same as __init__)
+
+        Raises:
+            ImportError: If ChromaDB is not installed
         """
+        try:
+            import chromadb
+        except ImportError:
+            raise ImportError(
+                "ChromaDB is required for LocalVectorStore. "
+                "Install it with: pip install chromadb"
+            )
+
         # Create persistent client
         self.client = chromadb.PersistentClient(path=self.path)
 
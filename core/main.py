@@ -12,7 +12,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.syntax import Syntax
-from rich.markdown import Markdown
 from rich import box
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -53,6 +52,9 @@ def render_assistant_message(text: str, title: str = "[bold green]Assistant[/bol
     ])
 
     if has_markdown:
+        # Imported lazily: rich.markdown pulls in markdown-it and pygments
+        from rich.markdown import Markdown
+
         # Render as markdown with syntax highlighting
         console.print(Panel(
             Markdown(text),
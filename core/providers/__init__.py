@@ -5,6 +5,8 @@ This module provides a factory pattern for loading AI providers (Claude, OpenAI,
 and ensures consistent interfaces across different platforms.
 """
 
+import functools
+
 from core.providers.base_provider import BaseProvider, ToolCall, ProviderResponse
 
 
@@ -12,6 +14,9 @@ def get_provider(provider_name: str) -> BaseProvider:
     """
     Factory function to get a provider instance by name.
 
+    Providers are stateless, so instances are cached per (lowercased) name
+    and repeated lookups return the same object.
+
     Args:
         provider_name: Name of the provider ('anthropic', 'openai', etc.)
 
@@ -26,7 +31,18 @@ def get_provider(provider_name: str) -> BaseProvider:
         >>> client = provider.create_client()
     """
     provider_name = provider_name.lower()
+    if not provider_name:
+        raise ValueError(
+            "Provider name must not be empty. "
+            "Supported providers: anthropic, openai, google"
+        )
+
+    return _load_provider(provider_name)
+
 
+@functools.lru_cache(maxsize=None)
+def _load_provider(provider_name: str) -> BaseProvider:
+    """Import and instantiate the provider for an already-lowercased name."""
     if provider_name == "anthropic":
         from core.providers.anthropic_provider import AnthropicProvider
         return AnthropicProvider()
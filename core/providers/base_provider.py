@@ -6,15 +6,18 @@ must implement to work with Synapse's agent orchestration system.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     """
     Standardized representation of a tool call from an AI provider.
 
+    Instances are immutable and hashable (by id and name) so they can be
+    used for deduplication and as cache keys.
+
     Attributes:
         id: Unique identifier for this tool call
         name: Name of the tool/function to invoke
@@ -22,10 +25,10 @@ class ToolCall:
     """
     id: str
     name: str
-    arguments: dict
+    arguments: dict = field(hash=False)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenUsage:
     """
     Standardized representation of token usage across providers.
@@ -42,7 +45,7 @@ class TokenUsage:
     cached_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProviderResponse:
     """
     Standardized representation of an AI provider's response.
@@ -55,8 +58,8 @@ class ProviderResponse:
         usage: Token usage information for this request
     """
     text: str | None
-    tool_calls: list[ToolCall]
-    raw_response: Any
+    tool_calls: list[ToolCall] = field(hash=False)
+    raw_response: Any = field(compare=False)
     finish_reason: str
     usage: TokenUsage | None = None
 
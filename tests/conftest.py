@@ -0,0 +1,52 @@
+"""
+Shared pytest configuration for the Synapse test suite.
+
+All tests in tests/test_rich_output.py and tests/test_provider_abstraction.py
+are xdist-safe: module-level state such as core.main.console is swapped with
+monkeypatch and neither module touches the filesystem, so they can run under
+`pytest -n auto tests/test_rich_output.py tests/test_provider_abstraction.py`.
+The rest of the suite has not been checked for xdist safety.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+# Shared by test_todoist_agent.py and test_todoist_new_features.py. Each module
+# patches its own TodoistAPI import to return mock_todoist_api and defines its
+# own agent fixture; reset_todoist_state clears both before every test, so one
+# mock instance can serve the whole session.
+
+@pytest.fixture(scope="module")
+def mock_env():
+    """Set up environment variables."""
+    with patch.dict(os.environ, {
+        "TODOIST_API_TOKEN": "test_token_123",
+        "TIMEZONE": "Australia/Sydney",
+    }):
+        yield
+
+
+@pytest.fixture(scope="session")
+def mock_todoist_api():
+    """Create a mock TodoistAPI instance shared by the whole session."""
+    return Mock()
+
+
+@pytest.fixture(scope="session")
+def paged():
+    """Return a helper that wraps items in a one-shot, single-page iterator like the SDK's ResultsPaginator."""
+    def _paged(*items):
+        return iter([list(items)])
+    return _paged
+
+
+@pytest.fixture
+def reset_todoist_state(agent, mock_todoist_api):
+    """Reset the shared API mock and the requesting module's agent caches."""
+    mock_todoist_api.reset_mock(return_value=True, side_effect=True)
+    agent._projects_cache = None
+    agent._sections_cache = None
+    agent._labels_cache = None
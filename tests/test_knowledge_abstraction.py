@@ -7,6 +7,8 @@ Verifies that:
 3. LocalVectorStore can be instantiated
 """
 
+import sys
+
 import pytest
 from core.knowledge.base_store import BaseKnowledgeStore
 from core.knowledge import get_knowledge_store
@@ -123,6 +125,17 @@ class TestLocalVectorStoreInterface:
         assert store.collection_name == "default"
         assert store.chunk_size == 1000
 
+    def test_import_does_not_load_chromadb(self, monkeypatch):
+        """Test that importing LocalVectorStore defers the ChromaDB import."""
+        monkeypatch.delitem(sys.modules, "chromadb", raising=False)
+        monkeypatch.delitem(sys.modules, "core.knowledge.local_vector_store", raising=False)
+
+        from core.knowledge.local_vector_store import LocalVectorStore
+
+        LocalVectorStore({})
+
+        assert "chromadb" not in sys.modules
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -13,7 +13,7 @@ from pathlib import Path
 class TestLocalVectorStoreInitialization:
     """Test LocalVectorStore initialization and client creation."""
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_initialize_creates_persistent_client(self, mock_persistent_client):
         """Test that initialize creates a ChromaDB persistent client."""
         from core.knowledge.local_vector_store import LocalVectorStore
@@ -35,7 +35,7 @@ class TestLocalVectorStoreInitialization:
         assert store.client is not None
         assert store.collection is not None
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_initialize_called_automatically_on_query(self, mock_persistent_client):
         """Test that query() initializes store if not already initialized."""
         from core.knowledge.local_vector_store import LocalVectorStore
@@ -62,7 +62,7 @@ class TestLocalVectorStoreInitialization:
 class TestLocalVectorStoreQuery:
     """Test semantic search functionality."""
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_query_returns_documents(self, mock_persistent_client):
         """Test that query returns relevant documents."""
         from core.knowledge.local_vector_store import LocalVectorStore
@@ -89,7 +89,7 @@ class TestLocalVectorStoreQuery:
         assert len(results) == 3
         assert results[0] == "doc1 content"
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_query_handles_empty_results(self, mock_persistent_client):
         """Test that query handles empty results gracefully."""
         from core.knowledge.local_vector_store import LocalVectorStore
@@ -108,7 +108,7 @@ class TestLocalVectorStoreQuery:
 
         assert results == []
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_query_default_k_value(self, mock_persistent_client):
         """Test that query uses default k=5."""
         from core.knowledge.local_vector_store import LocalVectorStore
@@ -135,7 +135,7 @@ class TestLocalVectorStoreQuery:
 class TestLocalVectorStoreSync:
     """Test file indexing and synchronization."""
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     @patch("core.knowledge.local_vector_store.Path")
     def test_sync_indexes_files(self, mock_path_class, mock_persistent_client):
         """Test that sync indexes files from directory."""
@@ -188,7 +188,7 @@ class TestLocalVectorStoreSync:
             assert "metadatas" in call_args.kwargs
             assert "ids" in call_args.kwargs
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     @patch("core.knowledge.local_vector_store.Path")
     def test_sync_raises_for_nonexistent_directory(self, mock_path_class, mock_persistent_client):
         """Test that sync raises ValueError for nonexistent directory."""
@@ -217,7 +217,7 @@ class TestLocalVectorStoreSync:
 class TestLocalVectorStoreClear:
     """Test clearing functionality."""
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_clear_deletes_and_recreates_collection(self, mock_persistent_client):
         """Test that clear() deletes and recreates collection."""
         from core.knowledge.local_vector_store import LocalVectorStore
@@ -242,7 +242,7 @@ class TestLocalVectorStoreClear:
 class TestLocalVectorStoreStats:
     """Test statistics functionality."""
 
-    @patch("core.knowledge.local_vector_store.chromadb.PersistentClient")
+    @patch("chromadb.PersistentClient")
     def test_get_stats_returns_collection_info(self, mock_persistent_client):
         """Test that get_stats() returns collection information."""
         from core.knowledge.local_vector_store import LocalVectorStore
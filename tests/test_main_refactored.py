@@ -9,31 +9,31 @@ Verifies that main.py correctly:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from core.providers import ProviderResponse, ToolCall
+from types import SimpleNamespace
+from unittest.mock import Mock
+from core.providers import ProviderResponse, ToolCall, get_provider
 
 
 class TestAgentLoading:
     """Test that agents are loaded with provider configuration."""
 
-    @patch("core.main.load_agent")
-    @patch("core.main.get_provider")
-    def test_agent_loads_with_provider_field(self, mock_get_provider, mock_load_agent):
+    def test_agent_loads_with_provider_field(self, monkeypatch):
         """Test that agent has provider field and it's used."""
         # Mock agent with provider field
-        mock_agent = Mock()
-        mock_agent.name = "TestAgent"
-        mock_agent.provider = "anthropic"
-        mock_agent.model = "claude-sonnet-4.5"
-        mock_agent.system_prompt = "Test prompt"
-        mock_agent.tools = []
-        mock_load_agent.return_value = mock_agent
+        mock_agent = SimpleNamespace(
+            name="TestAgent",
+            provider="anthropic",
+            model="claude-sonnet-4.5",
+            system_prompt="Test prompt",
+            tools=[],
+        )
+        monkeypatch.setattr("core.main.load_agent", lambda *args, **kwargs: mock_agent)
 
         # Mock provider
         mock_provider = Mock()
         mock_provider.create_client.return_value = Mock()
         mock_provider.format_tool_schemas.return_value = []
-        mock_get_provider.return_value = mock_provider
+        monkeypatch.setattr("core.main.get_provider", lambda *args, **kwargs: mock_provider)
 
         # Import and test (will call setup code)
         from core.main import chat
@@ -48,17 +48,12 @@ class TestProviderIntegration:
 
     def test_provider_used_for_schema_generation(self):
         """Test that provider generates tool schemas."""
-        from core.providers import get_provider
-
-        # Create mock agent
-        mock_agent = Mock()
-        mock_agent.tools = ["test_tool"]
-
         def test_tool(arg: str) -> str:
             """Test tool."""
             return "result"
 
-        mock_agent.test_tool = test_tool
+        # Create mock agent
+        mock_agent = SimpleNamespace(tools=["test_tool"], test_tool=test_tool)
 
         # Get provider and generate schemas
         provider = get_provider("anthropic")
@@ -72,8 +67,6 @@ class TestProviderIntegration:
 
     def test_provider_formats_tool_results(self):
         """Test that provider formats tool results correctly."""
-        from core.providers import get_provider
-
         provider = get_provider("anthropic")
         result = provider.format_tool_results("call_123", "test output")
 
@@ -109,9 +102,7 @@ class TestToolExecutionFlow:
 class TestConfigurationCompatibility:
     """Test that configuration updates work correctly."""
 
-    @patch("core.agent_loader.open")
-    @patch("core.agent_loader.Path")
-    def test_agent_config_includes_provider(self, mock_path, mock_open):
+    def test_agent_config_includes_provider(self, monkeypatch):
         """Test that agent config includes provider field."""
         import yaml
         from io import StringIO
@@ -125,8 +116,15 @@ model: claude-sonnet-4.5
 tools:
   - test_tool
 """
+        mock_path = Mock()
         mock_path.return_value.exists.return_value = True
-        mock_open.return_value.__enter__.return_value = StringIO(config_content)
+        monkeypatch.setattr("core.agent_loader.Path", mock_path)
+        # StringIO is its own context manager, so it can stand in for open()
+        monkeypatch.setattr(
+            "core.agent_loader.open",
+            lambda *args, **kwargs: StringIO(config_content),
+            raising=False,
+        )
 
         # Parse config
         config = yaml.safe_load(config_content)
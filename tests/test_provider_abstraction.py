@@ -73,6 +73,23 @@ class TestDataClasses:
         assert response.text == "Just text"
         assert len(response.tool_calls) == 0
 
+    def test_toolcall_is_hashable(self):
+        """Test ToolCall is frozen and hashable for dedup/caching."""
+        call_a = ToolCall(id="call_1", name="tool1", arguments={"arg": "value"})
+        call_b = ToolCall(id="call_1", name="tool1", arguments={"arg": "value"})
+
+        assert hash(call_a) == hash(call_b)
+        assert len({call_a, call_b}) == 1
+
+        with pytest.raises(AttributeError):
+            call_a.name = "tool2"
+
+    def test_toolcall_has_no_dict(self):
+        """Test ToolCall uses slots instead of a per-instance __dict__."""
+        tool_call = ToolCall(id="call_1", name="tool1", arguments={})
+
+        assert not hasattr(tool_call, "__dict__")
+
 
 class TestBaseProvider:
     """Test that BaseProvider enforces abstract methods."""
@@ -161,6 +178,13 @@ class TestProviderFactory:
         assert provider2.__class__.__name__ == "AnthropicProvider"
         assert provider3.__class__.__name__ == "AnthropicProvider"
 
+    def test_provider_instances_are_cached(self):
+        """Test that repeated lookups return the same provider instance."""
+        provider1 = get_provider("anthropic")
+        provider2 = get_provider("ANTHROPIC")
+
+        assert provider1 is provider2
+
     def test_empty_provider_name(self):
         """Test that empty provider name raises ValueError."""
         with pytest.raises(ValueError):
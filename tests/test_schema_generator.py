@@ -0,0 +1,71 @@
+"""
+Tests for tool schema generation from agent methods.
+
+Verifies that:
+1. Tool methods are introspected into function schemas
+2. Schemas use the flat function-tool structure
+"""
+
+from typing import Literal
+
+import pytest
+from core.schema_generator import generate_tool_schemas
+
+
+class MockAgent:
+    """Minimal agent exposing one tool for schema generation."""
+
+    tools = ["create_task", "not_a_method"]
+
+    def create_task(
+        self,
+        content: str,
+        labels: list[str],
+        priority: Literal["low", "high"] = "low",
+        estimate: int = 0,
+    ) -> str:
+        """
+        Create a new task.
+
+        Args:
+            content: The task text
+            labels: Labels to attach
+            priority: How urgent the task is
+            estimate: Estimated minutes
+        """
+        return "ok"
+
+
+@pytest.fixture(scope="module")
+def schemas():
+    """Introspect MockAgent once and share the schemas across tests."""
+    return generate_tool_schemas(MockAgent())
+
+
+def test_generate_tool_schemas(schemas):
+    """Test that parameters, types and descriptions are extracted."""
+    assert len(schemas) == 1
+    schema = schemas[0]
+    assert schema["name"] == "create_task"
+    assert schema["description"] == "Create a new task."
+
+    properties = schema["parameters"]["properties"]
+    assert properties["content"] == {"description": "The task text", "type": "string"}
+    assert properties["labels"]["type"] == "array"
+    assert properties["labels"]["items"] == {"type": "string"}
+    assert properties["priority"]["enum"] == ["low", "high"]
+    assert properties["estimate"]["type"] == "integer"
+    assert schema["parameters"]["required"] == ["content", "labels"]
+
+
+def test_generate_tool_schemas_is_flat(schemas):
+    """Test that each schema is a flat function tool, not nested under 'function'."""
+    for schema in schemas:
+        assert schema["type"] == "function"
+        assert "function" not in schema
+        assert set(schema) == {"type", "name", "description", "parameters"}
+        assert schema["parameters"]["type"] == "object"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,109 +11,199 @@ Tests all Todoist API integration methods including:
 """
 
 import pytest
-import json
-from unittest.mock import Mock, MagicMock, patch
+from json import loads as _loads
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import patch
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from core.agents.todoist import TodoistAgent
-from todoist_api_python.models import Task, Project, Section, Label, Comment
 
 
-@pytest.fixture
-def mock_todoist_api():
-    """Create a mock TodoistAPI instance."""
-    with patch('core.agents.todoist.TodoistAPI') as mock_api_class:
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-        yield mock_api
+_AGENT_CONFIG = {
+    "name": "TodoistAgent",
+    "provider": "anthropic",
+    "model": "claude-sonnet-4-20250514",
+    "system_prompt": "Test prompt"
+}
 
 
-@pytest.fixture
-def mock_env(monkeypatch):
-    """Set up environment variables."""
-    monkeypatch.setenv("TODOIST_API_TOKEN", "test_token_123")
-    monkeypatch.setenv("TIMEZONE", "Australia/Sydney")
+# Read-only fixtures are module-scoped so the agent, the TodoistAPI patch and
+# the model stand-ins are built once per module; reset_todoist_state (requested
+# by _prime_todoist_agent_api below) gives every test a clean API mock and empty
+# agent caches. mock_env, mock_todoist_api, paged and reset_todoist_state come
+# from tests/conftest.py.
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_todoist_agent_api(mock_todoist_api):
+    """Make core.agents.todoist build its client from mock_todoist_api."""
+    with patch('core.agents.todoist.TodoistAPI', return_value=mock_todoist_api):
+        yield
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def agent(mock_env, mock_todoist_api):
     """Create a TodoistAgent instance with mocked API."""
-    config = {
-        "name": "TodoistAgent",
-        "provider": "anthropic",
-        "model": "claude-sonnet-4-20250514",
-        "system_prompt": "Test prompt"
+    return TodoistAgent(_AGENT_CONFIG)
+
+
+@dataclass(slots=True)
+class FakeTask:
+    """Read-only stand-in for todoist Task with the fields the agent reads."""
+    id: str
+    content: str
+    description: str
+    project_id: str
+    labels: list
+    priority: int
+    due: Any
+    url: str
+    created_at: str
+
+
+@dataclass(slots=True)
+class FakeProject:
+    """Read-only stand-in for todoist Project."""
+    id: str
+    name: str
+    color: str
+    is_favorite: bool
+
+
+@dataclass(slots=True)
+class FakeSection:
+    """Read-only stand-in for todoist Section."""
+    id: str
+    name: str
+    project_id: str
+
+
+@dataclass(slots=True)
+class FakeLabel:
+    """Read-only stand-in for todoist Label."""
+    id: str
+    name: str
+    color: str
+    is_favorite: bool
+
+
+@dataclass(slots=True)
+class FakeComment:
+    """Read-only stand-in for todoist Comment."""
+    id: str
+    content: str
+    posted_at: str
+
+
+def make_task(**overrides):
+    """Build a FakeTask with sensible defaults, overriding only what a test needs."""
+    fields = {
+        "id": "task123",
+        "content": "Test task",
+        "description": "",
+        "project_id": "proj123",
+        "labels": [],
+        "priority": 1,
+        "due": None,
+        "url": "https://todoist.com/app/task/123",
+        "created_at": "2025-01-01T00:00:00Z",
     }
-    return TodoistAgent(config)
+    fields.update(overrides)
+    return FakeTask(**fields)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_project():
-    """Create a mock Project."""
-    project = Mock(spec=Project)
-    project.id = "proj123"
-    project.name = "Processed"
-    project.color = "blue"
-    project.is_favorite = False
-    return project
+    """Create a stand-in Project."""
+    return FakeProject(
+        id="proj123",
+        name="Processed",
+        color="blue",
+        is_favorite=False,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_task():
-    """Create a mock Task."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Test task"
-    task.description = "Test description"
-    task.project_id = "proj123"
-    task.labels = ["home", "chore"]
-    task.priority = 1
-    task.due = None
-    task.url = "https://todoist.com/app/task/123"
-    task.created_at = "2025-01-01T00:00:00Z"
-    return task
+    """Create a stand-in Task."""
+    return FakeTask(
+        id="task123",
+        content="Test task",
+        description="Test description",
+        project_id="proj123",
+        labels=["home", "chore"],
+        priority=1,
+        due=None,
+        url="https://todoist.com/app/task/123",
+        created_at="2025-01-01T00:00:00Z",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_section():
-    """Create a mock Section."""
-    section = Mock(spec=Section)
-    section.id = "sect123"
-    section.name = "Today"
-    section.project_id = "proj123"
-    return section
+    """Create a stand-in Section."""
+    return FakeSection(
+        id="sect123",
+        name="Today",
+        project_id="proj123",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_label():
-    """Create a mock Label."""
-    label = Mock(spec=Label)
-    label.id = "label123"
-    label.name = "home"
-    label.color = "green"
-    label.is_favorite = False
-    return label
+    """Create a stand-in Label."""
+    return FakeLabel(
+        id="label123",
+        name="home",
+        color="green",
+        is_favorite=False,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_comment():
-    """Create a mock Comment."""
-    comment = Mock(spec=Comment)
-    comment.id = "comment123"
-    comment.content = "Test comment"
-    comment.posted_at = "2025-01-01T00:00:00Z"
-    return comment
+    """Create a stand-in Comment."""
+    return FakeComment(
+        id="comment123",
+        content="Test comment",
+        posted_at="2025-01-01T00:00:00Z",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _prime_todoist_agent_api(reset_todoist_state, mock_todoist_api, paged, mock_project, mock_section, mock_label):
+    """Give each test single-page project, section and label listings by default."""
+    mock_todoist_api.get_projects.return_value = paged(mock_project)
+    mock_todoist_api.get_sections.return_value = paged(mock_section)
+    mock_todoist_api.get_labels.return_value = paged(mock_label)
 
 
 # =============================================================================
 # TIME AWARENESS TESTS
 # =============================================================================
 
-def test_get_current_time(agent):
+# Loaded once here so the frozen clock never hits the tz database mid-test
+_SYDNEY_TZ = ZoneInfo("Australia/Sydney")
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns 2025-01-01 12:00 in the given tz."""
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2025, 1, 1, 12, 0, tzinfo=tz)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze datetime.now() inside the todoist agent module."""
+    monkeypatch.setattr("core.agents.todoist.datetime", _FrozenDatetime)
+
+
+def test_get_current_time(agent, frozen_now):
     """Test getting current time in user's timezone."""
     result = agent.get_current_time()
-    data = json.loads(result)
+    data = _loads(result)
 
     assert data["status"] == "success"
     assert "date" in data["data"]
@@ -121,27 +211,31 @@ def test_get_current_time(agent):
     assert "day_of_week" in data["data"]
     assert "timezone" in data["data"]
     assert data["data"]["timezone"] == "Australia/Sydney"
+    assert data["data"]["date"] == "2025-01-01"
+    assert data["data"]["day_of_week"] == "Wednesday"
 
 
-def test_get_current_time_includes_formats(agent):
+def test_get_current_time_includes_formats(agent, frozen_now):
     """Test that current time includes all required formats."""
     result = agent.get_current_time()
-    data = json.loads(result)
+    data = _loads(result)
 
     assert "date" in data["data"]  # YYYY-MM-DD
     assert "time_24h" in data["data"]  # HH:MM
     assert "time_12h" in data["data"]  # HH:MM AM/PM
     assert "iso8601" in data["data"]  # Full ISO format
+    assert data["data"]["time_24h"] == "12:00"
+    assert data["data"]["time_12h"] == "12:00 PM"
+    assert data["data"]["iso8601"] == datetime(2025, 1, 1, 12, 0, tzinfo=_SYDNEY_TZ).isoformat()
 
 
 # =============================================================================
 # TASK CREATION TESTS
 # =============================================================================
 
-def test_create_task_basic(agent, mock_todoist_api, mock_project, mock_task):
+def test_create_task_basic(agent, mock_todoist_api, mock_task):
     """Test basic task creation."""
     # Setup mocks
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
     mock_todoist_api.add_task.return_value = mock_task
 
     result = agent.create_task(
@@ -149,17 +243,15 @@ def test_create_task_basic(agent, mock_todoist_api, mock_project, mock_task):
         project_name="Processed"
     )
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert "task_id" in data["data"]
     mock_todoist_api.add_task.assert_called_once()
 
 
-def test_create_task_with_all_parameters(agent, mock_todoist_api, mock_project, mock_task, mock_section):
+def test_create_task_with_all_parameters(agent, mock_todoist_api, mock_task):
     """Test task creation with all parameters."""
     # Setup mocks
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.get_sections.return_value = iter([[mock_section]])
     mock_todoist_api.add_task.return_value = mock_task
 
     result = agent.create_task(
@@ -175,7 +267,7 @@ def test_create_task_with_all_parameters(agent, mock_todoist_api, mock_project,
         duration_unit="minute"
     )
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
 
     # Verify all parameters were passed
@@ -192,9 +284,8 @@ def test_create_task_with_all_parameters(agent, mock_todoist_api, mock_project,
     assert call_args["duration_unit"] == "minute"
 
 
-def test_create_task_strips_at_from_labels(agent, mock_todoist_api, mock_project, mock_task):
+def test_create_task_strips_at_from_labels(agent, mock_todoist_api, mock_task):
     """Test that @ prefix is stripped from labels."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
     mock_todoist_api.add_task.return_value = mock_task
 
     agent.create_task(
@@ -207,32 +298,27 @@ def test_create_task_strips_at_from_labels(agent, mock_todoist_api, mock_project
     assert call_args["labels"] == ["home", "chore"]
 
 
-def test_create_task_project_not_found(agent, mock_todoist_api, mock_project):
+def test_create_task_project_not_found(agent, mock_todoist_api):
     """Test error when project doesn't exist."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-
     result = agent.create_task(
         content="Task",
         project_name="NonexistentProject"
     )
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "error"
     assert data["error_type"] == "ProjectNotFound"
 
 
-def test_create_task_section_not_found(agent, mock_todoist_api, mock_project, mock_section):
+def test_create_task_section_not_found(agent, mock_todoist_api):
     """Test error when section doesn't exist."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.get_sections.return_value = iter([[mock_section]])
-
     result = agent.create_task(
         content="Task",
         project_name="Processed",
         section_name="NonexistentSection"
     )
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "error"
     assert data["error_type"] == "SectionNotFound"
 
@@ -241,196 +327,90 @@ def test_create_task_section_not_found(agent, mock_todoist_api, mock_project, mo
 # TASK LISTING TESTS
 # =============================================================================
 
-def test_list_tasks_all(agent, mock_todoist_api, mock_task):
+def test_list_tasks_all(agent, mock_todoist_api, mock_task, paged):
     """Test listing all tasks."""
-    mock_todoist_api.get_tasks.return_value = iter([[mock_task]])
+    mock_todoist_api.get_tasks.return_value = paged(mock_task)
 
     result = agent.list_tasks()
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert data["data"]["count"] == 1
     assert len(data["data"]["tasks"]) == 1
 
 
-def test_list_tasks_by_project(agent, mock_todoist_api, mock_project, mock_task):
+def test_list_tasks_by_project(agent, mock_todoist_api, mock_task, paged):
     """Test listing tasks filtered by project."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.get_tasks.return_value = iter([[mock_task]])
+    mock_todoist_api.get_tasks.return_value = paged(mock_task)
 
     result = agent.list_tasks(project_name="Processed")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     mock_todoist_api.get_tasks.assert_called_with(project_id="proj123")
 
 
-def test_list_tasks_by_label(agent, mock_todoist_api, mock_task):
+def test_list_tasks_by_label(agent, mock_todoist_api, mock_task, paged):
     """Test listing tasks filtered by label."""
-    mock_todoist_api.get_tasks.return_value = iter([[mock_task]])
+    mock_todoist_api.get_tasks.return_value = paged(mock_task)
 
     result = agent.list_tasks(label="@home")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     # Verify @ was stripped
     mock_todoist_api.get_tasks.assert_called_with(label="home")
 
 
-def test_list_tasks_by_filter(agent, mock_todoist_api, mock_task):
+def test_list_tasks_by_filter(agent, mock_todoist_api, mock_task, monkeypatch, paged):
     """Test listing tasks with local filter query."""
-    mock_task.content = "test task"  # Ensure task has content for filtering
-    mock_todoist_api.get_tasks.return_value = iter([[mock_task]])
+    monkeypatch.setattr(mock_task, "content", "test task")  # Ensure task has content for filtering
+    mock_todoist_api.get_tasks.return_value = paged(mock_task)
 
     result = agent.list_tasks(filter_query="test")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     # filter_query is applied locally after fetching all tasks
     mock_todoist_api.get_tasks.assert_called_with()
 
 
-def test_list_tasks_empty(agent, mock_todoist_api):
-    """Test listing tasks when none exist."""
-    mock_todoist_api.get_tasks.return_value = iter([[]])
+def test_list_tasks_includes_created_at(agent, mock_todoist_api, mock_task, paged):
+    """Test that list_tasks includes created_at field."""
+    mock_todoist_api.get_tasks.return_value = paged(mock_task)
 
     result = agent.list_tasks()
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
-    assert "No tasks found" in data["message"]
+    assert "created_at" in data["data"]["tasks"][0]
+    assert data["data"]["tasks"][0]["created_at"] == "2025-01-01T00:00:00Z"
 
 
-def test_list_tasks_includes_created_at(agent, mock_todoist_api, mock_task):
-    """Test that list_tasks includes created_at field."""
-    mock_todoist_api.get_tasks.return_value = iter([[mock_task]])
+@pytest.fixture(scope="module")
+def sortable_tasks():
+    """Three tasks whose creation order differs from their priority order."""
+    task1 = make_task(id="task1", content="Oldest task", priority=4, created_at="2025-01-01T00:00:00Z")
+    task2 = make_task(id="task2", content="Middle task", priority=1, created_at="2025-01-02T00:00:00Z")
+    task3 = make_task(id="task3", content="Newest task", priority=2, created_at="2025-01-03T00:00:00Z")
+    # Returned in an order that matches none of the sort orders below
+    return [task2, task3, task1]
 
-    result = agent.list_tasks()
 
-    data = json.loads(result)
-    assert data["status"] == "success"
-    assert "created_at" in data["data"]["tasks"][0]
-    assert data["data"]["tasks"][0]["created_at"] == "2025-01-01T00:00:00Z"
+@pytest.mark.parametrize("sort_by, expected_ids", [
+    ("created_desc", ["task3", "task2", "task1"]),  # newest first
+    ("created_asc", ["task1", "task2", "task3"]),  # oldest first
+    ("priority_desc", ["task1", "task3", "task2"]),  # highest priority first
+])
+def test_list_tasks_sort(agent, mock_todoist_api, sortable_tasks, sort_by, expected_ids, paged):
+    """Test sorting tasks by creation date and priority."""
+    mock_todoist_api.get_tasks.return_value = paged(*sortable_tasks)
 
+    result = agent.list_tasks(sort_by=sort_by)
 
-def test_list_tasks_sort_by_created_desc(agent, mock_todoist_api):
-    """Test sorting tasks by creation date (newest first)."""
-    # Create multiple tasks with different created_at times
-    task1 = Mock(spec=Task)
-    task1.id = "task1"
-    task1.content = "Oldest task"
-    task1.project_id = "proj123"
-    task1.labels = []
-    task1.priority = 1
-    task1.due = None
-    task1.url = "https://todoist.com/app/task/1"
-    task1.created_at = "2025-01-01T00:00:00Z"
-
-    task2 = Mock(spec=Task)
-    task2.id = "task2"
-    task2.content = "Middle task"
-    task2.project_id = "proj123"
-    task2.labels = []
-    task2.priority = 1
-    task2.due = None
-    task2.url = "https://todoist.com/app/task/2"
-    task2.created_at = "2025-01-02T00:00:00Z"
-
-    task3 = Mock(spec=Task)
-    task3.id = "task3"
-    task3.content = "Newest task"
-    task3.project_id = "proj123"
-    task3.labels = []
-    task3.priority = 1
-    task3.due = None
-    task3.url = "https://todoist.com/app/task/3"
-    task3.created_at = "2025-01-03T00:00:00Z"
-
-    mock_todoist_api.get_tasks.return_value = iter([[task1, task2, task3]])
-
-    result = agent.list_tasks(sort_by="created_desc")
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-    tasks = data["data"]["tasks"]
-
-    # Should be sorted newest first
-    assert tasks[0]["id"] == "task3"
-    assert tasks[1]["id"] == "task2"
-    assert tasks[2]["id"] == "task1"
-
-
-def test_list_tasks_sort_by_created_asc(agent, mock_todoist_api):
-    """Test sorting tasks by creation date (oldest first)."""
-    # Create multiple tasks with different created_at times
-    task1 = Mock(spec=Task)
-    task1.id = "task1"
-    task1.content = "Oldest task"
-    task1.project_id = "proj123"
-    task1.labels = []
-    task1.priority = 1
-    task1.due = None
-    task1.url = "https://todoist.com/app/task/1"
-    task1.created_at = "2025-01-01T00:00:00Z"
-
-    task2 = Mock(spec=Task)
-    task2.id = "task2"
-    task2.content = "Newest task"
-    task2.project_id = "proj123"
-    task2.labels = []
-    task2.priority = 1
-    task2.due = None
-    task2.url = "https://todoist.com/app/task/2"
-    task2.created_at = "2025-01-02T00:00:00Z"
-
-    mock_todoist_api.get_tasks.return_value = iter([[task2, task1]])  # Return in wrong order
-
-    result = agent.list_tasks(sort_by="created_asc")
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-    tasks = data["data"]["tasks"]
-
-    # Should be sorted oldest first
-    assert tasks[0]["id"] == "task1"
-    assert tasks[1]["id"] == "task2"
-
-
-def test_list_tasks_sort_by_priority_desc(agent, mock_todoist_api):
-    """Test sorting tasks by priority (highest first)."""
-    task1 = Mock(spec=Task)
-    task1.id = "task1"
-    task1.content = "High priority"
-    task1.project_id = "proj123"
-    task1.labels = []
-    task1.priority = 4
-    task1.due = None
-    task1.url = "https://todoist.com/app/task/1"
-    task1.created_at = "2025-01-01T00:00:00Z"
-
-    task2 = Mock(spec=Task)
-    task2.id = "task2"
-    task2.content = "Low priority"
-    task2.project_id = "proj123"
-    task2.labels = []
-    task2.priority = 1
-    task2.due = None
-    task2.url = "https://todoist.com/app/task/2"
-    task2.created_at = "2025-01-01T00:00:00Z"
-
-    mock_todoist_api.get_tasks.return_value = iter([[task2, task1]])  # Return in wrong order
-
-    result = agent.list_tasks(sort_by="priority_desc")
-
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
-    tasks = data["data"]["tasks"]
-
-    # Should be sorted by priority descending (4 before 1)
-    assert tasks[0]["id"] == "task1"
-    assert tasks[0]["priority"] == 4
-    assert tasks[1]["id"] == "task2"
-    assert tasks[1]["priority"] == 1
+    assert [task["id"] for task in data["data"]["tasks"]] == expected_ids
 
 
 # =============================================================================
@@ -448,7 +428,7 @@ def test_update_task(agent, mock_todoist_api, mock_task):
         due_string="tomorrow"
     )
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     mock_todoist_api.update_task.assert_called_once()
 
@@ -463,7 +443,7 @@ def test_update_task_with_duration(agent, mock_todoist_api, mock_task):
         duration_unit="minute"
     )
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
 
     call_args = mock_todoist_api.update_task.call_args[1]
@@ -475,7 +455,7 @@ def test_update_task_no_updates(agent):
     """Test error when no updates provided."""
     result = agent.update_task(task_id="task123")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "error"
     assert data["error_type"] == "InvalidInput"
 
@@ -490,7 +470,7 @@ def test_complete_task(agent, mock_todoist_api, mock_task):
 
     result = agent.complete_task(task_id="task123")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert "Completed task" in data["message"]
     mock_todoist_api.complete_task.assert_called_once_with("task123")
@@ -502,7 +482,7 @@ def test_reopen_task(agent, mock_todoist_api, mock_task):
 
     result = agent.reopen_task(task_id="task123")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert "Reopened task" in data["message"]
     mock_todoist_api.uncomplete_task.assert_called_once_with("task123")
@@ -514,7 +494,7 @@ def test_delete_task(agent, mock_todoist_api, mock_task):
 
     result = agent.delete_task(task_id="task123")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert "Deleted task" in data["message"]
     mock_todoist_api.delete_task.assert_called_once_with("task123")
@@ -524,27 +504,24 @@ def test_delete_task(agent, mock_todoist_api, mock_task):
 # TASK MOVEMENT TESTS
 # =============================================================================
 
-def test_move_task(agent, mock_todoist_api, mock_project, mock_task):
+def test_move_task(agent, mock_todoist_api, mock_task):
     """Test moving a task to another project."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
     mock_todoist_api.move_task.return_value = mock_task
     mock_todoist_api.get_task.return_value = mock_task  # Need to mock get_task since move_task calls it
 
     result = agent.move_task(task_id="task123", project_name="Processed")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert "Moved task" in data["message"]
     mock_todoist_api.move_task.assert_called_once_with("task123", project_id="proj123")
 
 
-def test_move_task_project_not_found(agent, mock_todoist_api, mock_project):
+def test_move_task_project_not_found(agent, mock_todoist_api):
     """Test error when moving to nonexistent project."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-
     result = agent.move_task(task_id="task123", project_name="NonexistentProject")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "error"
     assert data["error_type"] == "ProjectNotFound"
 
@@ -553,13 +530,11 @@ def test_move_task_project_not_found(agent, mock_todoist_api, mock_project):
 # PROJECT LISTING TESTS
 # =============================================================================
 
-def test_list_projects(agent, mock_todoist_api, mock_project):
+def test_list_projects(agent, mock_todoist_api):
     """Test listing all projects."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-
     result = agent.list_projects()
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert data["data"]["count"] == 1
     assert len(data["data"]["projects"]) == 1
@@ -570,66 +545,37 @@ def test_list_projects(agent, mock_todoist_api, mock_project):
 # SECTION LISTING TESTS
 # =============================================================================
 
-def test_list_sections_all(agent, mock_todoist_api, mock_section):
+def test_list_sections_all(agent, mock_todoist_api):
     """Test listing all sections."""
-    mock_todoist_api.get_sections.return_value = iter([[mock_section]])
-
     result = agent.list_sections()
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert data["data"]["count"] == 1
 
 
-def test_list_sections_by_project(agent, mock_todoist_api, mock_project, mock_section):
+def test_list_sections_by_project(agent, mock_todoist_api):
     """Test listing sections filtered by project."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.get_sections.return_value = iter([[mock_section]])
-
     result = agent.list_sections(project_name="Processed")
 
-    data = json.loads(result)
-    assert data["status"] == "success"
-
-
-def test_list_sections_empty(agent, mock_todoist_api):
-    """Test listing sections when none exist."""
-    mock_todoist_api.get_sections.return_value = iter([[]])
-
-    result = agent.list_sections()
-
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
-    assert "No sections found" in data["message"]
 
 
 # =============================================================================
 # LABEL LISTING TESTS
 # =============================================================================
 
-def test_list_labels(agent, mock_todoist_api, mock_label):
+def test_list_labels(agent, mock_todoist_api):
     """Test listing all labels."""
-    mock_todoist_api.get_labels.return_value = iter([[mock_label]])
-
     result = agent.list_labels()
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert data["data"]["count"] == 1
     assert data["data"]["labels"][0]["name"] == "home"
 
 
-def test_list_labels_empty(agent, mock_todoist_api):
-    """Test listing labels when none exist."""
-    mock_todoist_api.get_labels.return_value = iter([[]])
-
-    result = agent.list_labels()
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-    assert "No labels found" in data["message"]
-
-
 # =============================================================================
 # COMMENT TESTS
 # =============================================================================
@@ -640,7 +586,7 @@ def test_add_comment(agent, mock_todoist_api, mock_comment):
 
     result = agent.add_comment(task_id="task123", comment="Test comment")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert "Added comment" in data["message"]
     mock_todoist_api.add_comment.assert_called_once_with(
@@ -649,27 +595,37 @@ def test_add_comment(agent, mock_todoist_api, mock_comment):
     )
 
 
-def test_get_comments(agent, mock_todoist_api, mock_comment):
+def test_get_comments(agent, mock_todoist_api, mock_comment, paged):
     """Test getting comments for a task."""
-    mock_todoist_api.get_comments.return_value = iter([[mock_comment]])
+    mock_todoist_api.get_comments.return_value = paged(mock_comment)
 
     result = agent.get_comments(task_id="task123")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert data["data"]["count"] == 1
     assert len(data["data"]["comments"]) == 1
 
 
-def test_get_comments_empty(agent, mock_todoist_api):
-    """Test getting comments when none exist."""
-    mock_todoist_api.get_comments.return_value = iter([[]])
+# =============================================================================
+# EMPTY LISTING TESTS
+# =============================================================================
 
-    result = agent.get_comments(task_id="task123")
+@pytest.mark.parametrize("api_method, agent_method, kwargs, message", [
+    ("get_tasks", "list_tasks", {}, "No tasks found"),
+    ("get_sections", "list_sections", {}, "No sections found"),
+    ("get_labels", "list_labels", {}, "No labels found"),
+    ("get_comments", "get_comments", {"task_id": "task123"}, "No comments found"),
+])
+def test_list_empty(agent, mock_todoist_api, api_method, agent_method, kwargs, message, paged):
+    """Test listing methods report an empty result when nothing exists."""
+    getattr(mock_todoist_api, api_method).return_value = paged()
+
+    result = getattr(agent, agent_method)(**kwargs)
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
-    assert "No comments found" in data["message"]
+    assert message in data["message"]
 
 
 # =============================================================================
@@ -682,7 +638,7 @@ def test_get_task(agent, mock_todoist_api, mock_task):
 
     result = agent.get_task(task_id="task123")
 
-    data = json.loads(result)
+    data = _loads(result)
     assert data["status"] == "success"
     assert data["data"]["id"] == "task123"
     assert data["data"]["content"] == "Test task"
@@ -693,10 +649,8 @@ def test_get_task(agent, mock_todoist_api, mock_task):
 # CACHE TESTS
 # =============================================================================
 
-def test_project_cache(agent, mock_todoist_api, mock_project):
+def test_project_cache(agent, mock_todoist_api):
     """Test that projects are cached after first fetch."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-
     # First call
     agent._get_projects()
     # Second call should use cache
@@ -707,10 +661,8 @@ def test_project_cache(agent, mock_todoist_api, mock_project):
     assert mock_todoist_api.get_projects.call_count == 1
 
 
-def test_section_cache(agent, mock_todoist_api, mock_section):
+def test_section_cache(agent, mock_todoist_api):
     """Test that sections are cached after first fetch."""
-    mock_todoist_api.get_sections.return_value = iter([[mock_section]])
-
     # First call
     agent._get_sections()
     # Second call should use cache
@@ -721,10 +673,8 @@ def test_section_cache(agent, mock_todoist_api, mock_section):
     assert mock_todoist_api.get_sections.call_count == 1
 
 
-def test_label_cache(agent, mock_todoist_api, mock_label):
+def test_label_cache(agent, mock_todoist_api):
     """Test that labels are cached after first fetch."""
-    mock_todoist_api.get_labels.return_value = iter([[mock_label]])
-
     # First call
     agent._get_labels()
     # Second call should use cache
@@ -739,10 +689,8 @@ def test_label_cache(agent, mock_todoist_api, mock_label):
 # HELPER METHOD TESTS
 # =============================================================================
 
-def test_find_project_by_name_case_insensitive(agent, mock_todoist_api, mock_project):
+def test_find_project_by_name_case_insensitive(agent, mock_todoist_api):
     """Test that project search is case-insensitive."""
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-
     project = agent._find_project_by_name("processed")
     assert project is not None
     assert project.name == "Processed"
@@ -751,10 +699,8 @@ def test_find_project_by_name_case_insensitive(agent, mock_todoist_api, mock_pro
     assert project is not None
 
 
-def test_find_section_by_name_case_insensitive(agent, mock_todoist_api, mock_section):
+def test_find_section_by_name_case_insensitive(agent, mock_todoist_api):
     """Test that section search is case-insensitive."""
-    mock_todoist_api.get_sections.return_value = iter([[mock_section]])
-
     section = agent._find_section_by_name("today")
     assert section is not None
     assert section.name == "Today"
@@ -763,7 +709,7 @@ def test_find_section_by_name_case_insensitive(agent, mock_todoist_api, mock_sec
 def test_success_helper(agent):
     """Test _success helper formats response correctly."""
     result = agent._success("Test message", data={"key": "value"})
-    data = json.loads(result)
+    data = _loads(result)
 
     assert data["status"] == "success"
     assert data["message"] == "Test message"
@@ -773,7 +719,7 @@ def test_success_helper(agent):
 def test_error_helper(agent):
     """Test _error helper formats response correctly."""
     result = agent._error("TestError", "Error message")
-    data = json.loads(result)
+    data = _loads(result)
 
     assert data["status"] == "error"
     assert data["error_type"] == "TestError"
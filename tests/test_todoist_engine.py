@@ -1,28 +1,33 @@
 # tests/test_todoist_engine.py
 
+import json
+import re
 import pytest
 from unittest.mock import MagicMock, patch
 from core.todoist_engine import tasks
 
-def test_get_api_client_success():
+_TOKEN_ERR_RE = re.compile(r"TODOIST_API_TOKEN environment variable not set\.")
+
+def test_get_api_client_success(monkeypatch):
     """
     Tests that get_api_client returns a TodoistAPI instance when the token is set.
     """
-    with patch.dict('os.environ', {'TODOIST_API_TOKEN': 'fake_token'}):
-        api_client = tasks.get_api_client()
-        assert api_client is not None
-        # Further assertions can be made here about the type of the returned object
-        # For example, if TodoistAPI is the expected class:
-        # from todoist_api_python.api import TodoistAPI
-        # assert isinstance(api_client, TodoistAPI)
-
-def test_get_api_client_failure():
+    monkeypatch.setenv('TODOIST_API_TOKEN', 'fake_token')
+    api_client = tasks.get_api_client()
+    assert api_client is not None
+    # Further assertions can be made here about the type of the returned object
+    # For example, if TodoistAPI is the expected class:
+    # from todoist_api_python.api import TodoistAPI
+    # assert isinstance(api_client, TodoistAPI)
+
+def test_get_api_client_failure(monkeypatch):
     """
     Tests that get_api_client raises a ValueError when the token is not set.
     """
-    with patch.dict('os.environ', {}, clear=True):
-        with pytest.raises(ValueError, match="TODOIST_API_TOKEN environment variable not set."):
-            tasks.get_api_client()
+    monkeypatch.delenv('TODOIST_TOKEN', raising=False)
+    monkeypatch.delenv('TODOIST_API_TOKEN', raising=False)
+    with pytest.raises(ValueError, match=_TOKEN_ERR_RE):
+        tasks.get_api_client()
 
 class TestTaskFunctions:
     """Test suite for core task functions in the todoist engine."""
@@ -73,7 +78,6 @@ class TestTaskFunctions:
 
         result_json = tasks.update_task(self.mock_api, task_id="123", content="Updated content")
 
-        import json
         result = json.loads(result_json)
 
         assert result["status"] == "success"
@@ -97,7 +101,6 @@ class TestTaskFunctions:
 
             result_json = tasks.create_task(self.mock_api, content="New Task", project_name="Inbox")
 
-            import json
             result = json.loads(result_json)
 
             assert result["status"] == "success"
@@ -8,70 +8,102 @@ Tests include:
 """
 
 import pytest
-import json
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 from core.agents.todoist_openai import TodoistAgent
-from todoist_api_python.models import Task, Project
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-@pytest.fixture
-def mock_todoist_api():
-    """Create a mock TodoistAPI instance."""
-    with patch('core.agents.todoist_openai.TodoistAPI') as mock_api_class:
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-        yield mock_api
+_AGENT_CONFIG = {
+    "name": "TodoistAgent",
+    "provider": "openai",
+    "model": "gpt-4o-mini",
+    "system_prompt": "Test prompt"
+}
 
 
-@pytest.fixture
-def mock_env(monkeypatch):
-    """Set up environment variables."""
-    monkeypatch.setenv("TODOIST_API_TOKEN", "test_token_123")
-    monkeypatch.setenv("TIMEZONE", "Australia/Sydney")
+# mock_env, mock_todoist_api, paged and reset_todoist_state come from tests/conftest.py
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_todoist_openai_api(mock_todoist_api):
+    """Make core.agents.todoist_openai build its client from mock_todoist_api."""
+    with patch('core.agents.todoist_openai.TodoistAPI', return_value=mock_todoist_api):
+        yield
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def agent(mock_env, mock_todoist_api):
     """Create a TodoistAgent instance with mocked API."""
-    config = {
-        "name": "TodoistAgent",
-        "provider": "openai",
-        "model": "gpt-4o-mini",
-        "system_prompt": "Test prompt"
-    }
-    return TodoistAgent(config)
+    return TodoistAgent(_AGENT_CONFIG)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_project():
-    """Create a mock Project."""
-    project = Mock(spec=Project)
-    project.id = "proj123"
-    project.name = "Inbox"
-    project.color = "blue"
-    project.is_favorite = False
-    return project
+    """Create a read-only stand-in Project."""
+    return SimpleNamespace(id="proj123", name="Inbox", color="blue", is_favorite=False)
+
+
+@pytest.fixture(autouse=True)
+def _prime_new_features_projects(reset_todoist_state, mock_todoist_api, paged, mock_project):
+    """Serve a fresh single-page project listing on every get_projects call."""
+    mock_todoist_api.get_projects.side_effect = lambda *args, **kwargs: paged(mock_project)
+
+
+@pytest.fixture(scope="module")
+def task_mock():
+    """Create the read-only Task stand-in returned by add_task/update_task."""
+    return SimpleNamespace(id="task123", content="Test task", url="https://todoist.com/app/task/123")
 
 
 # =============================================================================
 # LIST_TASKS RETURNS LABELS IN DATA PAYLOAD
 # =============================================================================
 
-def test_list_tasks_includes_labels_in_data(agent, mock_todoist_api):
-    """Test that list_tasks returns labels array in data payload."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Test task"
-    task.labels = ["home", "chore"]
-    task.priority = 1
-    task.due = None
-    task.project_id = "proj123"
-    task.created_at = "2025-01-01T00:00:00Z"
+_TASK_WITH_LABELS = SimpleNamespace(
+    id="task123",
+    content="Test task",
+    labels=["home", "chore"],
+    priority=1,
+    due=None,
+    project_id="proj123",
+    created_at="2025-01-01T00:00:00Z",
+)
+
+_TASK_WITH_PRIORITY = SimpleNamespace(
+    id="task123",
+    content="High priority task",
+    labels=[],
+    priority=4,
+    due=None,
+    project_id="proj123",
+    created_at="2025-01-01T00:00:00Z",
+)
+
+_TASK_WITH_DUE = SimpleNamespace(
+    id="task123",
+    content="Task with due date",
+    labels=[],
+    priority=1,
+    due=SimpleNamespace(string="tomorrow"),
+    project_id="proj123",
+    created_at="2025-01-01T00:00:00Z",
+)
 
-    mock_todoist_api.get_tasks.return_value = iter([[task]])
 
-    result = agent.list_tasks()
-    data = json.loads(result)
+@pytest.fixture
+def list_tasks_response(agent, mock_todoist_api, request, paged):
+    """Run list_tasks over the parametrized task and return the parsed response."""
+    mock_todoist_api.get_tasks.return_value = paged(request.param)
+    return loads(agent.list_tasks())
+
+
+@pytest.mark.parametrize("list_tasks_response", [_TASK_WITH_LABELS], indirect=True)
+def test_list_tasks_includes_labels_in_data(list_tasks_response):
+    """Test that list_tasks returns labels array in data payload."""
+    data = list_tasks_response
 
     assert data["status"] == "success"
     assert "tasks" in data["data"]
@@ -83,45 +115,18 @@ def test_list_tasks_includes_labels_in_data(agent, mock_todoist_api):
     assert task_data["labels"] == ["home", "chore"]
 
 
-def test_list_tasks_includes_priority_in_data(agent, mock_todoist_api):
+@pytest.mark.parametrize("list_tasks_response", [_TASK_WITH_PRIORITY], indirect=True)
+def test_list_tasks_includes_priority_in_data(list_tasks_response):
     """Test that list_tasks returns priority in data payload."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "High priority task"
-    task.labels = []
-    task.priority = 4
-    task.due = None
-    task.project_id = "proj123"
-    task.created_at = "2025-01-01T00:00:00Z"
-
-    mock_todoist_api.get_tasks.return_value = iter([[task]])
-
-    result = agent.list_tasks()
-    data = json.loads(result)
-
-    task_data = data["data"]["tasks"][0]
+    task_data = list_tasks_response["data"]["tasks"][0]
     assert "priority" in task_data
     assert task_data["priority"] == 4
 
 
-def test_list_tasks_includes_due_in_data(agent, mock_todoist_api):
+@pytest.mark.parametrize("list_tasks_response", [_TASK_WITH_DUE], indirect=True)
+def test_list_tasks_includes_due_in_data(list_tasks_response):
     """Test that list_tasks returns due date in data payload."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Task with due date"
-    task.labels = []
-    task.priority = 1
-    task.due = Mock()
-    task.due.string = "tomorrow"
-    task.project_id = "proj123"
-    task.created_at = "2025-01-01T00:00:00Z"
-
-    mock_todoist_api.get_tasks.return_value = iter([[task]])
-
-    result = agent.list_tasks()
-    data = json.loads(result)
-
-    task_data = data["data"]["tasks"][0]
+    task_data = list_tasks_response["data"]["tasks"][0]
     assert "due" in task_data
     assert task_data["due"] == "tomorrow"
 
@@ -130,188 +135,88 @@ def test_list_tasks_includes_due_in_data(agent, mock_todoist_api):
 # LABEL FIXING TESTS
 # =============================================================================
 
-def test_create_task_splits_comma_separated_labels(agent, mock_todoist_api, mock_project):
-    """Test that create_task handles comma-separated labels passed as string."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Test task"
-    task.url = "https://todoist.com/app/task/123"
-
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.add_task.return_value = task
-
-    # Simulate AI accidentally passing comma-separated string
-    result = agent.create_task(
-        content="Test task",
-        project_name="Inbox",
-        labels="home,chore,yard"  # This is wrong, but should be handled
-    )
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-
-    # Verify labels were split correctly
-    call_args = mock_todoist_api.add_task.call_args[1]
-    assert call_args["labels"] == ["home", "chore", "yard"]
-
-
-def test_create_task_strips_at_symbols_from_labels(agent, mock_todoist_api, mock_project):
-    """Test that @ symbols are stripped from labels."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Test task"
-    task.url = "https://todoist.com/app/task/123"
-
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.add_task.return_value = task
-
-    result = agent.create_task(
-        content="Test task",
-        project_name="Inbox",
-        labels=["@home", "@chore", "@yard"]
-    )
-
-    data = json.loads(result)
+@pytest.mark.parametrize("api_method, labels_in, labels_out", [
+    # AI accidentally passing a comma-separated string
+    ("add_task", "home,chore,yard", ["home", "chore", "yard"]),
+    ("add_task", ["@home", "@chore", "@yard"], ["home", "chore", "yard"]),
+    ("add_task", " @waiting for , @errands", ["waiting for", "errands"]),
+    # Fixing a malformed label like "yard,@maintenance,@weather"
+    ("update_task", ["yard", "maintenance", "weather", "medenergy", "medium"],
+     ["yard", "maintenance", "weather", "medenergy", "medium"]),
+    ("update_task", "@next,@plan,@yard", ["next", "plan", "yard"]),
+])
+def test_labels_are_normalized(agent, mock_todoist_api, task_mock, api_method, labels_in, labels_out):
+    """Test that create_task/update_task split comma-separated labels and strip @."""
+    api_call = getattr(mock_todoist_api, api_method)
+    api_call.return_value = task_mock
+
+    if api_method == "add_task":
+        result = agent.create_task(content="Test task", project_name="Inbox", labels=labels_in)
+    else:
+        result = agent.update_task(task_id="task123", labels=labels_in)
+
+    data = loads(result)
     assert data["status"] == "success"
+    assert api_call.call_args[1]["labels"] == labels_out
 
-    # Verify @ symbols were stripped
-    call_args = mock_todoist_api.add_task.call_args[1]
-    assert call_args["labels"] == ["home", "chore", "yard"]
 
+@pytest.mark.parametrize("api_method, labels_in", [
+    ("add_task", "@"),
+    ("add_task", " , "),
+    ("update_task", ""),
+    ("update_task", "@"),
+    ("update_task", " , "),
+])
+def test_label_string_without_labels_is_rejected(agent, mock_todoist_api, api_method, labels_in):
+    """Test that a label string yielding no labels errors instead of wiping the task's labels."""
+    if api_method == "add_task":
+        data = loads(agent.create_task(content="Test task", project_name="Inbox", labels=labels_in))
+    else:
+        data = loads(agent.update_task(task_id="task123", labels=labels_in))
 
-def test_update_task_fixes_malformed_labels(agent, mock_todoist_api):
-    """Test that update_task can fix malformed labels."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Updated task"
-
-    mock_todoist_api.update_task.return_value = task
-
-    # Simulate fixing a malformed label like "yard,@maintenance,@weather"
-    result = agent.update_task(
-        task_id="task123",
-        labels=["yard", "maintenance", "weather", "medenergy", "medium"]
-    )
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-
-    call_args = mock_todoist_api.update_task.call_args[1]
-    assert call_args["labels"] == ["yard", "maintenance", "weather", "medenergy", "medium"]
-
-
-def test_update_task_handles_comma_and_at_symbols(agent, mock_todoist_api):
-    """Test that update_task strips both commas and @ symbols."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Updated task"
-
-    mock_todoist_api.update_task.return_value = task
-
-    # Simulate label with both commas and @ symbols: "@next,@plan"
-    result = agent.update_task(
-        task_id="task123",
-        labels="@next,@plan,@yard"  # Should split on comma and strip @
-    )
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-
-    call_args = mock_todoist_api.update_task.call_args[1]
-    assert call_args["labels"] == ["next", "plan", "yard"]
+    assert data["status"] == "error"
+    assert data["error_type"] == "InvalidLabels"
+    getattr(mock_todoist_api, api_method).assert_not_called()
 
 
 # =============================================================================
 # DATE HANDLING TESTS
 # =============================================================================
 
-def test_create_task_accepts_yyyy_mm_dd_format(agent, mock_todoist_api, mock_project):
-    """Test that create_task accepts YYYY-MM-DD date format."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Task with explicit date"
-    task.url = "https://todoist.com/app/task/123"
-
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.add_task.return_value = task
+@pytest.mark.parametrize("due_string", [
+    "2025-11-03",  # YYYY-MM-DD
+    "2025-11-03 10:00",  # YYYY-MM-DD HH:MM
+    "every monday at 9am",  # natural language still works for recurring tasks
+])
+def test_create_task_accepts_due_string_formats(agent, mock_todoist_api, task_mock, due_string):
+    """Test that create_task passes explicit dates and recurring phrases through unchanged."""
+    mock_todoist_api.add_task.return_value = task_mock
 
     result = agent.create_task(
-        content="Task due specific date",
+        content="Task with due date",
         project_name="Inbox",
-        due_string="2025-11-03"
+        due_string=due_string
     )
 
-    data = json.loads(result)
+    data = loads(result)
     assert data["status"] == "success"
 
     call_args = mock_todoist_api.add_task.call_args[1]
-    assert call_args["due_string"] == "2025-11-03"
-
-
-def test_create_task_accepts_yyyy_mm_dd_with_time(agent, mock_todoist_api, mock_project):
-    """Test that create_task accepts YYYY-MM-DD HH:MM format."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Task with time"
-    task.url = "https://todoist.com/app/task/123"
-
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.add_task.return_value = task
-
-    result = agent.create_task(
-        content="Task due at specific time",
-        project_name="Inbox",
-        due_string="2025-11-03 10:00"
-    )
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-
-    call_args = mock_todoist_api.add_task.call_args[1]
-    assert call_args["due_string"] == "2025-11-03 10:00"
-
-
-def test_create_task_accepts_recurring_natural_language(agent, mock_todoist_api, mock_project):
-    """Test that create_task still accepts natural language for recurring tasks."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Recurring task"
-    task.url = "https://todoist.com/app/task/123"
-
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.add_task.return_value = task
-
-    result = agent.create_task(
-        content="Weekly task",
-        project_name="Inbox",
-        due_string="every monday at 9am"
-    )
-
-    data = json.loads(result)
-    assert data["status"] == "success"
-
-    call_args = mock_todoist_api.add_task.call_args[1]
-    assert call_args["due_string"] == "every monday at 9am"
+    assert call_args["due_string"] == due_string
 
 
 # =============================================================================
 # PROJECT NAMING TESTS (# symbol handling)
 # =============================================================================
 
-def test_create_task_defaults_to_inbox(agent, mock_todoist_api, mock_project):
+def test_create_task_defaults_to_inbox(agent, mock_todoist_api, task_mock):
     """Test that create_task defaults to Inbox project."""
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Default project task"
-    task.url = "https://todoist.com/app/task/123"
-
-    mock_todoist_api.get_projects.return_value = iter([[mock_project]])
-    mock_todoist_api.add_task.return_value = task
+    mock_todoist_api.add_task.return_value = task_mock
 
     # Don't specify project_name, should default to Inbox
     result = agent.create_task(content="Test task")
 
-    data = json.loads(result)
+    data = loads(result)
     assert data["status"] == "success"
 
     # Verify it used Inbox project
@@ -319,21 +224,17 @@ def test_create_task_defaults_to_inbox(agent, mock_todoist_api, mock_project):
     assert call_args["project_id"] == "proj123"  # Inbox project ID
 
 
-def test_create_task_finds_inbox_case_insensitive(agent, mock_todoist_api):
+def test_create_task_finds_inbox_case_insensitive(agent, mock_todoist_api, task_mock, paged):
     """Test that project lookup is case-insensitive."""
-    inbox_project = Mock(spec=Project)
-    inbox_project.id = "inbox123"
-    inbox_project.name = "Inbox"  # Capital I
-    inbox_project.color = "blue"
-    inbox_project.is_favorite = False
-
-    task = Mock(spec=Task)
-    task.id = "task123"
-    task.content = "Task"
-    task.url = "https://todoist.com/app/task/123"
+    inbox_project = SimpleNamespace(
+        id="inbox123",
+        name="Inbox",  # Capital I
+        color="blue",
+        is_favorite=False,
+    )
 
-    mock_todoist_api.get_projects.return_value = iter([[inbox_project]])
-    mock_todoist_api.add_task.return_value = task
+    mock_todoist_api.get_projects.side_effect = lambda *args, **kwargs: paged(inbox_project)
+    mock_todoist_api.add_task.return_value = task_mock
 
     # Try with lowercase "inbox"
     result = agent.create_task(
@@ -341,7 +242,7 @@ def test_create_task_finds_inbox_case_insensitive(agent, mock_todoist_api):
         project_name="inbox"  # lowercase
     )
 
-    data = json.loads(result)
+    data = loads(result)
     assert data["status"] == "success"
 
 
@@ -349,35 +250,32 @@ def test_create_task_finds_inbox_case_insensitive(agent, mock_todoist_api):
 # PAGINATION TESTS
 # =============================================================================
 
-def test_get_tasks_list_handles_pagination(agent, mock_todoist_api):
+@pytest.fixture(scope="module")
+def paginated_tasks():
+    """Two pages of read-only tasks: a full page of 50 and a partial page of 35."""
+    def make_task(i):
+        return SimpleNamespace(
+            id=f"task{i}",
+            content=f"Task {i}",
+            labels=[],
+            priority=1,
+            due=None,
+            project_id="proj123",
+            created_at="2025-01-01T00:00:00Z",
+        )
+
+    return [make_task(i) for i in range(50)], [make_task(i) for i in range(50, 85)]
+
+
+def test_get_tasks_list_handles_pagination(agent, mock_todoist_api, paginated_tasks):
     """Test that _get_tasks_list properly handles pagination."""
-    # Create multiple pages of tasks
-    page1_tasks = [Mock(spec=Task) for _ in range(50)]
-    page2_tasks = [Mock(spec=Task) for _ in range(35)]
-
-    for i, task in enumerate(page1_tasks):
-        task.id = f"task{i}"
-        task.content = f"Task {i}"
-        task.labels = []
-        task.priority = 1
-        task.due = None
-        task.project_id = "proj123"
-        task.created_at = "2025-01-01T00:00:00Z"
-
-    for i, task in enumerate(page2_tasks):
-        task.id = f"task{i+50}"
-        task.content = f"Task {i+50}"
-        task.labels = []
-        task.priority = 1
-        task.due = None
-        task.project_id = "proj123"
-        task.created_at = "2025-01-01T00:00:00Z"
+    page1_tasks, page2_tasks = paginated_tasks
 
     # Mock paginator returns two pages
     mock_todoist_api.get_tasks.return_value = iter([page1_tasks, page2_tasks])
 
     result = agent.list_tasks()
-    data = json.loads(result)
+    data = loads(result)
 
     assert data["status"] == "success"
     # Should return ALL 85 tasks, not just first 50